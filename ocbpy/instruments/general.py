@@ -26,13 +26,20 @@ def test_file(filename):
     good_flag : (bool)
         True if good, bad if false
     """
-    from os import path
+    from os import stat
+    from stat import S_ISREG
 
-    if not path.isfile(filename):
+    # Get the file type and size from a single status call
+    try:
+        fstat = stat(filename)
+    except (OSError, ValueError):
+        fstat = None
+
+    if fstat is None or not S_ISREG(fstat.st_mode):
         logging.warning("name provided is not a file")
         return False
     
-    fsize = path.getsize(filename)
+    fsize = fstat.st_size
 
     if(fsize > 2.0e9):
         logging.warning("File size [{:.2f} GB > 2 GB]".format(fsize*1e-9))
@@ -218,53 +225,57 @@ def load_ascii_data(filename, hlines, miss=None, fill=np.nan, hsplit=None,
         logging.error("unable to read data in file [{:s}]".format(filename))
         return header, out
 
+    temp = np.atleast_1d(temp)
+
     if len(temp) > 0:
+        # When dtype is specified, output comes as a np.array of np.void
+        # objects, where each named field holds a full data column
+        if temp.dtype.names is None or len(temp.dtype.names) != nhead:
+            estr = "unknown genfromtxt output for [{:s}]".format(filename)
+            logging.error(estr)
+            return header, dict()
+
         noff = 0
-        # When dtype is specified, output comes as a np.array of np.void objects
-        for line in temp:
-            if len(line) == nhead:
-                for num,name in enumerate(keylist):
-                    if len(name) > 0:
-                        if idt < len(dt_keys) and name == dt_keys[idt]:
-                            # Build the convert_time input
-                            for icol,dcol in enumerate(datetime_cols):
-                                if dfmt_parts[dcol].find("%") == 0:
-                                    if dfmt_parts[dcol][1] in time_formats:
-                                        ckey = "tod"
-                                    else:
-                                        ckey = "date"
-                                else:
-                                    ckey = dfmt_parts[dcol].lower()
-                                    if ckey in ['year', 'soy']:
-                                        line[dcol] = int(line[dcol])
-                                    elif ckey == 'sod':
-                                        line[dcol] = float(line[dcol])
-                                        
-                                convert_time_input[ckey] = line[dcol]
-                                
-                            # Convert the string into a datetime object
-                            try:
-                                ftime = ocbt.convert_time(**convert_time_input)
-                            except ValueError as v:
-                                raise v
-
-                            # Save the output data
-                            out[dt_keys[idt]].append(ftime)
+        for num,name in enumerate(keylist):
+            if len(name) == 0:
+                noff += 1
+            elif idt < len(dt_keys) and name == dt_keys[idt]:
+                # Get the convert_time input key for each datetime column
+                dt_ckeys = list()
+                for dcol in datetime_cols:
+                    if dfmt_parts[dcol].startswith("%"):
+                        if dfmt_parts[dcol][1] in time_formats:
+                            dt_ckeys.append("tod")
                         else:
-                            out[name].append(line[num-noff])
+                            dt_ckeys.append("date")
                     else:
-                        noff += 1
+                        dt_ckeys.append(dfmt_parts[dcol].lower())
+
+                # Build the datetime for each line of data
+                out[name] = np.empty(shape=temp.shape, dtype=object)
+                for iline,line in enumerate(temp):
+                    # Build the convert_time input
+                    for dcol,ckey in zip(datetime_cols, dt_ckeys):
+                        if ckey in ['year', 'soy']:
+                            convert_time_input[ckey] = int(line[dcol])
+                        elif ckey == 'sod':
+                            convert_time_input[ckey] = float(line[dcol])
+                        else:
+                            convert_time_input[ckey] = line[dcol]
+
+                    # Convert the string into a datetime object and save it
+                    out[name][iline] = ocbt.convert_time(**convert_time_input)
             else:
-                estr = "unknown genfromtxt output for [{:s}]".format(filename)
-                logging.error(estr)
-                return header, dict()
+                # Save the data column
+                out[name] = temp[temp.dtype.names[num-noff]]
 
     del temp
-    # Cast all lists and numpy arrays
+    # Cast all remaining lists as numpy arrays
     for k in out.keys():
-        try:
-            out[k] = np.array(out[k], dtype=type(out[k][0]))
-        except:
-            pass
+        if isinstance(out[k], list):
+            try:
+                out[k] = np.array(out[k], dtype=type(out[k][0]))
+            except:
+                pass
 
     return header, out
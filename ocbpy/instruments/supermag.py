@@ -69,10 +69,10 @@ def supermag2ascii_ocb(smagfile, outfile, ocb=None, ocbfile=None,
     # Read the superMAG data and calculate the magnetic field magnitude
     header, mdata = load_supermag_ascii_data(smagfile)
 
-    # Remove the data with NaNs
-    igood = [i for i, mlt in enumerate(mdata['MLT']) if not np.isnan(mlt)
-             and not np.isnan(mdata['MLAT'][i]) and not np.isnan(mdata['BE'][i])
-             and not np.isnan(mdata['BN'][i]) and not np.isnan(mdata['BZ'][i])]
+    # Remove the data with NaNs, using a mask built for all records at once
+    igood = ~(np.isnan(mdata['MLT']) | np.isnan(mdata['MLAT']) |
+              np.isnan(mdata['BE']) | np.isnan(mdata['BN']) |
+              np.isnan(mdata['BZ']))
 
     for k in mdata.keys():
         mdata[k] = mdata[k][igood]
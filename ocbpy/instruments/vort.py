@@ -216,6 +216,11 @@ def load_vorticity_ascii_data(vortfile, save_all=False):
               "C2_GLAT", "C2_GLON", "C3_GLAT", "C3_GLON", "C4_GLAT", "C4_GLON"],
              ["MFLG", "CENTRE_MLAT", "CENTRE_MLON", "C1_MLAT", "C1_MLON",
               "C2_MLAT", "C2_MLON", "C3_MLAT", "C3_MLON", "C4_MLAT", "C4_MLON"]]
+
+    # Find the column of each desired key in the data block lines once, so
+    # that each line only needs to be split and cast
+    bcols = [[(bk, ik) for ik,bk in enumerate(bklist) if bk in vkeys]
+             for bklist in bkeys]
     
     # Read the lines and assign data.  Recall that blank lines in file are
     # returned as '\n'
@@ -237,11 +242,11 @@ def load_vorticity_ascii_data(vortfile, save_all=False):
             yy = int(vsplit[0])
             mm = int(vsplit[1])
             dd = int(vsplit[2])
-            hh = float(vsplit.pop())
+            hh = float(vsplit[3])
 
-            # Calculate and save the datetime
-            stime = " ".join(vsplit)
-            dtime = (dt.datetime.strptime(stime, "%Y %m %d") +
+            # Calculate and save the datetime from the values already cast,
+            # rather than joining and parsing the date string again
+            dtime = (dt.datetime(yy, mm, dd) +
                      dt.timedelta(seconds=np.floor(hh * 3600.0)))
             vinc += 1
         elif vinc == 1:
@@ -267,7 +272,7 @@ def load_vorticity_ascii_data(vortfile, save_all=False):
                 vdata['UTH'].append(hh)
                 vdata['DATETIME'].append(dtime)
 
-                for bklist in bkeys:
+                for bklist,bkcols in zip(bkeys, bcols):
                     # Test to see that this line has the right number of col
                     if len(vsplit) != len(bklist):
                         estr = "unexpected line encountered for a data block "
@@ -277,10 +282,7 @@ def load_vorticity_ascii_data(vortfile, save_all=False):
                         return None
 
                     # Save all desired keys
-                    gkeys = list(vkeys.intersection(bklist))
-
-                    for gk in gkeys:
-                        ik = bklist.index(gk)
+                    for gk,ik in bkcols:
                         vdata[gk].append(float(vsplit[ik]))
 
                     # Move to next line
@@ -7,6 +7,8 @@
 
 Functions
 -------------------------------------------------------------------------------
+year_soy_to_datetime64(yyyy, soy)
+    Converts from seconds of year to numpy datetime64, accepting arrays
 year_soy_to_datetime(yyyy, soy)
     Converts from seconds of year to datetime
 yyddd_to_date(yyddd)
@@ -22,6 +24,44 @@ Angeline G. Burrell (AGB), 15 April 2017, University of Texas, Dallas (UTDallas)
 import logbook as logging
 import datetime as dt
 
+def year_soy_to_datetime64(yyyy, soy):
+    """Converts year and soy to numpy datetime64
+
+    Parameters
+    -----------
+    yyyy : (int or array-like)
+        4 digit year
+    soy : (float or array-like)
+        seconds of year, rounded to the nearest second
+
+    Returns
+    ---------
+    dt64 : (np.datetime64 or np.ndarray)
+        datetime64[s] value or array of values
+
+    Raises
+    -------
+    ValueError if any seconds of year are not finite, are negative, or
+    are greater than or equal to 366 days
+    """
+    import numpy as np
+
+    yyyy = np.asarray(yyyy)
+    soy = np.asarray(soy)
+
+    # Add the seconds of year to the start of the year.  This avoids building
+    # and parsing a date string for each time
+    dt64 = ((yyyy - 1970).astype('datetime64[Y]') +
+            np.round(soy).astype('timedelta64[s]'))
+
+    if np.any(np.isnat(dt64)):
+        raise ValueError("unable to convert non-finite seconds of year")
+
+    if np.any(soy < 0) or np.any(soy >= 366 * 86400):
+        raise ValueError("seconds of year must be between 0 and 366 days")
+
+    return dt64
+
 def year_soy_to_datetime(yyyy, soy):
     """Converts year and soy to datetime
 
@@ -37,25 +77,7 @@ def year_soy_to_datetime(yyyy, soy):
     dtime : (dt.datetime)
         datetime object
     """
-    import numpy as np
-                
-    # Calcuate doy, hour, min, seconds of day
-    ss = soy / 86400.0
-    ddd = np.floor(ss)
-
-    ss = (soy - ddd * 86400.0) / 3600.0
-    hh = np.floor(ss)
-
-    ss = (soy - ddd * 86400.0 - hh * 3600.0) / 60.0
-    mm = np.floor(ss)
-
-    ss = soy - ddd * 86400.0 - hh * 3600.0 - mm * 60.0
-    
-    # Define format
-    stime = "{:d}-{:.0f}-{:.0f}-{:.0f}-{:.0f}".format(yyyy, ddd + 1, hh, mm, ss)
-
-    # Convert to datetime
-    dtime = dt.datetime.strptime(stime, "%Y-%j-%H-%M-%S")
+    dtime = year_soy_to_datetime64(yyyy, soy).item()
 
     return dtime
 
@@ -29,6 +29,45 @@ Chisham, G. (2017), A new methodology for the development of high-latitude
 import logbook as logging
 import numpy as np
 
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 provides intern as a builtin
+    pass
+
+# Instrument file formats, given as the number of header lines, the data column
+# names, the datetime format, and the typical boundary latitude
+_inst_defaults = {"image":(0, "year soy num_sectors phi_cent r_cent r a r_err",
+                           "", 74.0),
+                  "ampere":(0, "date time r x y j_mag", "%Y%m%d %H:%M", 72.0)}
+
+# Instrument and hemisphere combinations that have a default boundary file
+_default_inst_hemi = set([("image", 1)])
+
+# Default boundary file locations, keyed by the ocbpy installation location
+_default_file_cache = dict()
+
+def _get_default_file():
+    """ Get the full path to the default OCB file, only building it once for
+    each ocbpy installation location
+
+    Returns
+    -------
+    default_file : (str)
+        Full path of the default OCB file
+    """
+    from os import path
+    import ocbpy
+
+    cache_key = (ocbpy.__file__, ocbpy.__default_file__)
+
+    if cache_key not in _default_file_cache:
+        ocb_dir = path.dirname(ocbpy.__file__)
+        _default_file_cache[cache_key] = path.normpath(path.join(ocb_dir, \
+                                                    ocbpy.__default_file__))
+
+    return _default_file_cache[cache_key]
+
 class OCBoundary(object):
     """ Object containing open-closed field-line boundary (OCB) data
 
@@ -37,7 +76,8 @@ class OCBoundary(object):
     filename : (str or NoneType)
         File containing the required open-closed circle boundary data sorted by
         time.  If NoneType, no file is loaded.  If 'default', the
-        default IMAGE FUV file is loaded (if available). (default='default')
+        default northern hemisphere IMAGE FUV file is loaded (if available).
+        (default='default')
     instrument : (str)
         Instrument providing the OCBoundaries (default='image')
     hemisphere : (int)
@@ -129,7 +169,8 @@ class OCBoundary(object):
             self.filename = None
             self.instrument = None
         else:
-            self.instrument = instrument.lower()
+            # Intern the instrument name, as it is used for dict lookups
+            self.instrument = intern(instrument.lower())
 
             if filename is None:
                 self.filename = None
@@ -137,15 +178,14 @@ class OCBoundary(object):
                 logging.warning("file is not a string [{:s}]".format(filename))
                 self.filename = None
             elif filename.lower() == "default":
-                if instrument.lower() == "image":
-                    ocb_dir = ocbpy.__file__.split("/")
-                    self.filename = "{:s}/{:s}".format("/".join(ocb_dir[:-1]),
-                                                       ocbpy.__default_file__)
+                if (self.instrument, hemisphere) in _default_inst_hemi:
+                    self.filename = _get_default_file()
                     if not ocbpy.instruments.test_file(self.filename):
                         logging.warning("problem with default OC Boundary file")
                         self.filename = None
                 else:
-                    logging.warning("default OC Boundary file uses IMAGE data")
+                    estr = "default OC Boundary file uses northern IMAGE data"
+                    logging.warning(estr)
                     self.filename = None
             elif not ocbpy.instruments.test_file(filename):
                 logging.warning("cannot open OCB file [{:s}]".format(filename))
@@ -160,6 +200,8 @@ class OCBoundary(object):
         self.phi_cent = None
         self.r_cent = None
         self.r = None
+        self._good_limits = None
+        self._good_ind = None
 
         # Get the instrument defaults
         hlines, ocb_cols, datetime_fmt = self.inst_defaults()
@@ -233,16 +275,10 @@ class OCBoundary(object):
             String containing the datetime format
         """
 
-        if self.instrument == "image":
-            hlines = 0
-            ocb_cols = "year soy num_sectors phi_cent r_cent r a r_err"
-            datetime_fmt = ""
-            self.boundary_lat = self.hemisphere * 74.0
-        elif self.instrument == "ampere":
-            hlines = 0
-            ocb_cols = "date time r x y j_mag"
-            datetime_fmt = "%Y%m%d %H:%M"
-            self.boundary_lat = self.hemisphere * 72.0
+        if self.instrument in _inst_defaults:
+            hlines, ocb_cols, datetime_fmt, blat = \
+                _inst_defaults[self.instrument]
+            self.boundary_lat = self.hemisphere * blat
         else:
             hlines = 0
             ocb_cols = ""
@@ -307,28 +343,42 @@ class OCBoundary(object):
         #
         # Start by getting the time and location in the desired format
         self.rec_ind = -1
+        self._good_limits = None
 
-        dt_list = list()
-        if stime is None and etime is None:
-            itime = np.arange(0, odata.shape[0], 1)
-        else:
-            itime = list()
+        if dflag == 0:
+            # Calculate the times for all records at once and select the
+            # desired time range using a mask.  The datetime64 values are then
+            # cast as datetime objects.  Non-finite times raise a ValueError
+            dt64 = ocbt.year_soy_to_datetime64(odata.year, odata.soy)
+            itime = np.ones(shape=dt64.shape, dtype=bool)
 
-        for i in range(odata.shape[0]):
-            year = odata.year[i] if dflag == 0 else None
-            soy = odata.soy[i] if dflag == 0 else None
-            date = None if dflag == 0 else odata.date[i]
-            tod = None if dflag == 0 else odata.time[i]
-                
-            dtime = ocbt.convert_time(year=year, soy=soy, date=date, tod=tod,
-                                      datetime_fmt=datetime_fmt)
+            if stime is not None:
+                itime &= (dt64 >= np.datetime64(stime))
+            if etime is not None:
+                itime &= (dt64 <= np.datetime64(etime))
 
+            dt_list = dt64[itime].astype(dt.datetime)
+        else:
+            dt_list = list()
             if stime is None and etime is None:
-                dt_list.append(dtime)
-            elif((stime is None or stime <= dtime) and
-                 (etime is None or etime >= dtime)):
-                dt_list.append(dtime)
-                itime.append(i)
+                itime = np.arange(0, odata.shape[0], 1)
+            else:
+                itime = list()
+
+            for i in range(odata.shape[0]):
+                dtime = ocbt.convert_time(date=odata.date[i],
+                                          tod=odata.time[i],
+                                          datetime_fmt=datetime_fmt)
+
+                if stime is None and etime is None:
+                    dt_list.append(dtime)
+                elif etime is not None and etime < dtime:
+                    # The file is sorted by time, so no later records are
+                    # needed
+                    break
+                elif stime is None or stime <= dtime:
+                    dt_list.append(dtime)
+                    itime.append(i)
 
         if hasattr(odata, 'x') and hasattr(odata, 'y'):
             # Location is given by x-y coordinates where the origin lies
@@ -351,7 +401,11 @@ class OCBoundary(object):
         self.records = len(dt_list)
         self.dtime = np.array(dt_list)
 
-        # Load the attributes saved in odata
+        # Load the attributes saved in odata.  If all records were selected,
+        # keep the columns of the loaded record array instead of copying them
+        if self.records == odata.shape[0]:
+            itime = slice(None)
+
         for nn in oname:
             setattr(self, nn, getattr(odata, nn)[itime])
 
@@ -393,27 +447,35 @@ class OCBoundary(object):
         - that the OCB 'radius' is greater than 10 and less than 23 degrees
         """
 
-        # Incriment forward from previous boundary
-        self.rec_ind += 1
-        
-        while self.rec_ind < self.records:
-            # Evaluate the current boundary for quality, using optional
-            # parameters
-            good = True
-            if(hasattr(self, "num_sectors") and
-               self.num_sectors[self.rec_ind] < min_sectors):
-                good = False
-            elif hasattr(self, "j_mag") and self.j_mag[self.rec_ind] < min_j:
-                good = False
-
-            # Evaluate the current boundary for quality, using non-optional
-            # parameters
-            if(good and self.r_cent[self.rec_ind] <= rcent_dev and
-               self.r[self.rec_ind] >= min_r and self.r[self.rec_ind] <= max_r):
-                return
-
-            # Cycle to next boundary
-            self.rec_ind += 1
+        # Evaluate all of the boundaries for quality at once, only repeating
+        # the evaluation if the quality limits or loaded data have changed
+        good_limits = (min_sectors, rcent_dev, max_r, min_r, min_j)
+
+        if self._good_limits != good_limits:
+            if self.records > 0:
+                # Evaluate the boundaries using non-optional parameters
+                good = ((self.r_cent <= rcent_dev) & (self.r >= min_r) &
+                        (self.r <= max_r))
+
+                # Evaluate the boundaries using optional parameters
+                if hasattr(self, "num_sectors"):
+                    good &= ~(self.num_sectors < min_sectors)
+                if hasattr(self, "j_mag"):
+                    good &= ~(self.j_mag < min_j)
+
+                self._good_ind = np.flatnonzero(good)
+            else:
+                self._good_ind = np.array([], dtype=int)
+
+            self._good_limits = good_limits
+
+        # Incriment forward from previous boundary to the next good boundary
+        inext = np.searchsorted(self._good_ind, self.rec_ind + 1)
+
+        if inext < len(self._good_ind):
+            self.rec_ind = int(self._good_ind[inext])
+        else:
+            self.rec_ind = max(self.rec_ind + 1, self.records)
 
         return
 
@@ -557,6 +619,7 @@ def match_data_ocb(ocb, dat_dtime, idat=0, max_tol=600, min_sectors=7,
     """
     import ocbpy.ocboundary as ocboundary
     import datetime as dt
+    from bisect import bisect_left
 
     dat_records = len(dat_dtime)
 
@@ -580,14 +643,15 @@ def match_data_ocb(ocb, dat_dtime, idat=0, max_tol=600, min_sectors=7,
             estr = "{:s}{:}".format(estr, ocb.dtime[ocb.rec_ind])
             logging.info(estr)
 
-        # Cycle past data occuring before the specified OC boundary point
+        # Cycle past data occuring before the specified OC boundary point.
+        # The data are sorted by time, so the first data index that could
+        # match may be found using a binary search
         first_ocb = ocb.dtime[ocb.rec_ind] - dt.timedelta(seconds=max_tol)
-        while dat_dtime[idat] < first_ocb:
-            idat += 1
+        idat = bisect_left(dat_dtime, first_ocb, lo=idat)
 
-            if idat >= dat_records:
-                logging.error("no input data close enough to first record")
-                return None
+        if idat >= dat_records:
+            logging.error("no input data close enough to first record")
+            return None
 
     # If the times match, return
     if ocb.dtime[ocb.rec_ind] == dat_dtime[idat]:
@@ -600,7 +664,10 @@ def match_data_ocb(ocb, dat_dtime, idat=0, max_tol=600, min_sectors=7,
 
         if sdiff < -max_tol:
             # Cycle to the next OCB value since the lowest vorticity value
-            # is in the future
+            # is in the future.  No OCB record before the data time minus the
+            # tolerance can match, so skip past them using a binary search
+            last_ocb = dat_dtime[idat] - dt.timedelta(seconds=max_tol)
+            ocb.rec_ind = bisect_left(ocb.dtime, last_ocb, lo=ocb.rec_ind) - 1
             ocb.get_next_good_ocb_ind(min_sectors=min_sectors,
                                       rcent_dev=rcent_dev, max_r=max_r,
                                       min_r=min_r, min_j=min_j)
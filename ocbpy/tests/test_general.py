@@ -13,21 +13,32 @@ import logbook
 
 class TestGeneralMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file, as well as
-        the VectorData object
+    @classmethod
+    def setUpClass(cls):
+        """ Set the test file names and logging handler once for all of the
+        tests
         """
         from os import path
         import ocbpy
-        
+
         ocb_dir = path.split(ocbpy.__file__)[0]
-        self.test_file = path.join(ocb_dir, "tests", "test_data",
-                                   "test_north_circle")
-        self.assertTrue(path.isfile(self.test_file))
-        self.temp_output = path.join(ocb_dir, "tests", "test_data",
-                                     "temp_gen")
-        self.log_handler = logbook.TestHandler()
-        self.log_handler.push_thread()
+        cls.test_file = path.join(ocb_dir, "tests", "test_data",
+                                  "test_north_circle")
+        cls.temp_output = path.join(ocb_dir, "tests", "test_data", "temp_gen")
+
+        # Use the same logging handler for all of the tests
+        cls.log_handler = logbook.TestHandler()
+        cls.log_handler.push_thread()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.log_handler.pop_thread()
+        del cls.test_file, cls.temp_output, cls.log_handler
+
+    def setUp(self):
+        """ Clear the log records from any previous tests
+        """
+        del self.log_handler.records[:]
 
     def tearDown(self):
         import os
@@ -35,9 +46,6 @@ class TestGeneralMethods(unittest.TestCase):
         if os.path.isfile(self.temp_output):
             os.remove(self.temp_output)
 
-        self.log_handler.pop_thread()
-        del self.test_file, self.log_handler
-
     def test_file_test_true(self):
         """ Test the general file testing routine with a good file
         """
@@ -49,8 +57,8 @@ class TestGeneralMethods(unittest.TestCase):
         self.assertFalse(ocb_igen.test_file("/"))
 
         self.assertEqual(len(self.log_handler.formatted_records), 1)
-        self.assertTrue(self.log_handler.formatted_records[0].find( \
-                                            'name provided is not a file') > 0)
+        self.assertIn('name provided is not a file',
+                      self.log_handler.formatted_records[0])
 
     def test_file_test_empty_file(self):
         """ Test the general file testing routine with a bad filename
@@ -61,8 +69,7 @@ class TestGeneralMethods(unittest.TestCase):
         self.assertFalse(ocb_igen.test_file(self.temp_output))
 
         self.assertEqual(len(self.log_handler.formatted_records), 1)
-        self.assertTrue(self.log_handler.formatted_records[0].find('empty file')
-                        > 0)
+        self.assertIn('empty file', self.log_handler.formatted_records[0])
 
     def test_load_ascii_data_badfile(self):
         """ Test the general loading routine for ASCII data with bad input
@@ -74,8 +81,8 @@ class TestGeneralMethods(unittest.TestCase):
         self.assertEqual(len(data.keys()), 0)
 
         self.assertEqual(len(self.log_handler.formatted_records), 1)
-        self.assertTrue(self.log_handler.formatted_records[0].find( \
-                                            'name provided is not a file') > 0)
+        self.assertIn('name provided is not a file',
+                      self.log_handler.formatted_records[0])
 
     def test_load_ascii_data_standard(self):
         """ Test the general routine to load ASCII data
@@ -209,6 +216,37 @@ class TestGeneralMethods(unittest.TestCase):
 
         del hh, header, data, ktest, test_vals
 
+    def test_load_ascii_data_single_line(self):
+        """ Test the general routine to load a single line of ASCII data
+        """
+        import datetime as dt
+
+        # Create a file containing only the first line of the test file
+        with open(self.test_file, "r") as fin:
+            line = fin.readline()
+
+        with open(self.temp_output, "w") as fout:
+            fout.write(line)
+
+        hh = ["YEAR SOY NB PHICENT RCENT R A RERR"]
+        header, data = ocb_igen.load_ascii_data(self.temp_output, 0,
+                                                datetime_cols=[0,1],
+                                                datetime_fmt="YEAR SOY",
+                                                header=hh)
+
+        # Test the length of the data file
+        self.assertEqual(data['A'].shape[0], 1)
+
+        # Test the values of the only data line
+        test_vals = {"YEAR":2000, "SOY":10841727, "NB":4.0, "A":3.642e+06,
+                     "PHICENT":356.93, "RCENT":8.74, "R":9.69, "RERR":0.14,
+                     "datetime":dt.datetime(2000,1,1) +
+                     dt.timedelta(seconds=10841727)}
+        for kk in test_vals.keys():
+            self.assertEqual(data[kk][0], test_vals[kk])
+
+        del line, hh, header, data, test_vals
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -18,6 +18,44 @@ class TestOCBTimeMethods(unittest.TestCase):
         self.assertEqual(ocbpy.ocb_time.year_soy_to_datetime(2001, 0),
                          dt.datetime(2001,1,1))
 
+        # Test a time within the year, and a fractional second
+        self.assertEqual(ocbpy.ocb_time.year_soy_to_datetime(2000, 11187202),
+                         dt.datetime(2000,5,9,11,33,22))
+        self.assertEqual(ocbpy.ocb_time.year_soy_to_datetime(2000, 59.6),
+                         dt.datetime(2000,1,1,0,1,0))
+
+    def test_year_soy_to_datetime64(self):
+        """ Test to see that the array seconds of year conversion works
+        """
+        import numpy as np
+
+        dt64 = ocbpy.ocb_time.year_soy_to_datetime64([2001, 2000],
+                                                     [0, 11187202])
+        np.testing.assert_array_equal(dt64,
+                                      np.array(["2001-01-01T00:00:00",
+                                                "2000-05-09T11:33:22"],
+                                               dtype='datetime64[s]'))
+
+    def test_year_soy_to_datetime_nan(self):
+        """ Test to see that non-finite seconds of year raise a ValueError
+        """
+        import numpy as np
+
+        with self.assertRaises(ValueError):
+            ocbpy.ocb_time.year_soy_to_datetime(2001, np.nan)
+
+        with self.assertRaises(ValueError):
+            ocbpy.ocb_time.year_soy_to_datetime64([2001, 2001], [0, np.nan])
+
+    def test_year_soy_to_datetime_out_of_range(self):
+        """ Test to see that seconds of year outside the year raise a ValueError
+        """
+        with self.assertRaises(ValueError):
+            ocbpy.ocb_time.year_soy_to_datetime(2001, -10)
+
+        with self.assertRaises(ValueError):
+            ocbpy.ocb_time.year_soy_to_datetime(2001, 366 * 86400 + 5)
+
     def test_convert_time_date_tod(self):
         """ Test to see that the datetime construction works
         """
@@ -8,27 +8,46 @@
 
 import ocbpy
 import unittest
+import copy
 
 class TestOCBoundaryMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file
+    @classmethod
+    def setUpClass(cls):
+        """ Load the OCBoundary test files once for all of the tests
         """
         from os import path
 
         ocb_dir = path.split(ocbpy.__file__)
-        test_north = path.join(ocb_dir[0], "tests", "test_data",
-                               "test_north_circle")
-        test_south = path.join(ocb_dir[0], "tests", "test_data",
-                               "test_south_circle")
-        self.assertTrue(path.isfile(test_north))
-        self.assertTrue(path.isfile(test_south))
-        self.ocb = ocbpy.ocboundary.OCBoundary(filename=test_north)
-        self.ocb_south = ocbpy.ocboundary.OCBoundary(filename=test_south,
-                                                     instrument="Ampere",
-                                                     hemisphere=-1)
+        cls.test_north = path.join(ocb_dir[0], "tests", "test_data",
+                                   "test_north_circle")
+        cls.test_south = path.join(ocb_dir[0], "tests", "test_data",
+                                   "test_south_circle")
+        cls.temp_output = path.join(ocb_dir[0], "tests", "test_data",
+                                    "temp_ocb")
+        cls.ocb_north = ocbpy.ocboundary.OCBoundary(filename=cls.test_north)
+        cls.ocb_south_hemi = ocbpy.ocboundary.OCBoundary( \
+                                filename=cls.test_south, instrument="Ampere",
+                                hemisphere=-1)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.test_north, cls.test_south, cls.temp_output
+        del cls.ocb_north, cls.ocb_south_hemi
+
+    def setUp(self):
+        """ Copy the loaded OCBoundary objects, so that each test can change
+        the record index without affecting the others
+        """
+        self.ocb = copy.deepcopy(self.ocb_north)
+        self.ocb_south = copy.deepcopy(self.ocb_south_hemi)
 
     def tearDown(self):
+        import os
+
+        if os.path.isfile(self.temp_output):
+            os.remove(self.temp_output)
+
         del self.ocb, self.ocb_south
 
     def test_nofile_init(self):
@@ -41,6 +60,38 @@ class TestOCBoundaryMethods(unittest.TestCase):
         self.assertEqual(nofile_ocb.records, 0)
         del nofile_ocb
 
+    def test_default_file(self):
+        """ Ensure that the default file exists, and that its path follows
+        the ocbpy installation location
+        """
+        from os import path, makedirs
+        import shutil
+        import tempfile
+
+        default_file = path.normpath(path.join(path.dirname(ocbpy.__file__),
+                                               ocbpy.__default_file__))
+
+        self.assertTrue(path.isfile(default_file))
+        self.assertTrue(default_file.endswith("si13_north_circle"))
+
+        # Temporarily point ocbpy at a different location containing a small
+        # copy of the default file
+        ocb_file = ocbpy.__file__
+        temp_dir = tempfile.mkdtemp()
+        temp_file = path.normpath(path.join(temp_dir, ocbpy.__default_file__))
+        try:
+            makedirs(path.dirname(temp_file))
+            shutil.copy(self.test_north, temp_file)
+            ocbpy.__file__ = path.join(temp_dir, "__init__.py")
+
+            self.assertEqual(ocbpy.ocboundary.OCBoundary().filename, temp_file)
+        finally:
+            ocbpy.__file__ = ocb_file
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(ocbpy.ocboundary._get_default_file(), default_file)
+        del default_file, ocb_file, temp_dir, temp_file
+
     def test_wrong_instrument(self):
         """ Ensure that no file is loaded if user wants an instrument other
         than image, but asks for default file
@@ -52,11 +103,28 @@ class TestOCBoundaryMethods(unittest.TestCase):
         self.assertIsNone(nofile_ocb.dtime)
         self.assertEqual(nofile_ocb.records, 0)
         del nofile_ocb
+
+    def test_wrong_hemisphere(self):
+        """ Ensure that no file is loaded if user wants the southern
+        hemisphere, but asks for the default file
+        """
+
+        nofile_ocb = ocbpy.ocboundary.OCBoundary(hemisphere=-1)
+
+        self.assertIsNone(nofile_ocb.filename)
+        self.assertIsNone(nofile_ocb.dtime)
+        self.assertEqual(nofile_ocb.records, 0)
+        del nofile_ocb
         
     def test_load(self):
         """ Ensure that records from the default file were loaded and the
         default latitude boundary was set
         """
+        from os import path
+
+        self.assertTrue(path.isfile(self.test_north))
+        self.assertTrue(path.isfile(self.test_south))
+
         self.assertGreater(self.ocb.records, 0)
         self.assertEqual(self.ocb.boundary_lat, 74.0)
 
@@ -80,6 +148,23 @@ class TestOCBoundaryMethods(unittest.TestCase):
         self.assertEqual(part_ocb.boundary_lat, 75.0)
         del part_ocb
 
+    def test_nan_soy_load(self):
+        """ Ensure a ValueError is raised when a record has a non-finite time
+        """
+        with open(self.test_north, "r") as fin:
+            lines = [fin.readline() for i in range(5)]
+
+        # Replace the seconds of year in the third record with NaN
+        line = lines[2].split()
+        line[1] = "nan"
+        lines[2] = "  ".join(line) + "\n"
+
+        with open(self.temp_output, "w") as fout:
+            fout.write("".join(lines))
+
+        with self.assertRaises(ValueError):
+            ocbpy.ocboundary.OCBoundary(filename=self.temp_output)
+
     def test_first_good(self):
         """ Test to see that we can find the first good point
         """
@@ -95,6 +180,23 @@ class TestOCBoundaryMethods(unittest.TestCase):
         self.assertGreater(self.ocb_south.rec_ind, -1)
         self.assertLess(self.ocb_south.rec_ind, self.ocb_south.records)
 
+    def test_good_limits_change(self):
+        """ Test to see that changing the quality limits changes the next good
+        point
+        """
+        self.ocb.rec_ind = -1
+        self.ocb.get_next_good_ocb_ind()
+        self.assertEqual(self.ocb.rec_ind, 27)
+
+        self.ocb.rec_ind = -1
+        self.ocb.get_next_good_ocb_ind(min_sectors=9)
+        self.assertEqual(self.ocb.rec_ind, 37)
+
+        # Test that there are no more good points after the last record
+        self.ocb.rec_ind = self.ocb.records - 1
+        self.ocb.get_next_good_ocb_ind()
+        self.assertEqual(self.ocb.rec_ind, self.ocb.records)
+
     def test_normal_coord_north(self):
         """ Test to see that the normalisation is performed properly in the
         northern hemisphere
@@ -157,5 +259,25 @@ class TestOCBoundaryMethods(unittest.TestCase):
                         600.0)
         del test_times, idat
 
+    def test_match_cycle_data(self):
+        """ Test to see that data before the first good OCB are skipped
+        """
+        import numpy as np
+        import datetime as dt
+
+        # Build a array of times for a test dataset that starts well before
+        # the first good OCB record
+        test_times = np.arange(self.ocb.dtime[0] - dt.timedelta(seconds=3600),
+                               self.ocb.dtime[32],
+                               dt.timedelta(seconds=600)).astype(dt.datetime)
+
+        idat = ocbpy.ocboundary.match_data_ocb(self.ocb, test_times, idat=0)
+        self.assertEqual(idat, 18)
+        self.assertEqual(self.ocb.rec_ind, 27)
+        self.assertLess(abs((test_times[idat] -
+                             self.ocb.dtime[self.ocb.rec_ind]).total_seconds()),
+                        600.0)
+        del test_times, idat
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,23 +11,27 @@ import numpy as np
 
 class TestSuperMAGMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file, as well as
-        the VectorData object
+    @classmethod
+    def setUpClass(cls):
+        """ Set the test file names once for all of the tests
         """
         from os import path
         import ocbpy
         
-        self.ocb_dir = path.split(ocbpy.__file__)[0]
-        self.test_ocb = path.join(self.ocb_dir, "tests", "test_data",
-                                  "test_north_circle")
-        self.test_file = path.join(self.ocb_dir, "tests", "test_data",
-                                   "test_smag")
-        self.test_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "out_smag")
-        self.temp_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "temp_smag")
-        self.assertTrue(path.isfile(self.test_file))
+        cls.ocb_dir = path.split(ocbpy.__file__)[0]
+        cls.test_ocb = path.join(cls.ocb_dir, "tests", "test_data",
+                                 "test_north_circle")
+        cls.test_file = path.join(cls.ocb_dir, "tests", "test_data",
+                                  "test_smag")
+        cls.test_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "out_smag")
+        cls.temp_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "temp_smag")
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.ocb_dir, cls.test_file, cls.test_output, cls.test_ocb
+        del cls.temp_output
 
     def tearDown(self):
         import os
@@ -35,13 +39,13 @@ class TestSuperMAGMethods(unittest.TestCase):
         if os.path.isfile(self.temp_output):
             os.remove(self.temp_output)
 
-        del self.test_file, self.test_output, self.test_ocb, self.temp_output
-
     def test_load_supermag_ascii_data(self):
         """ Test the routine to load the SuperMAG data
         """
         import datetime as dt
+        from os import path
 
+        self.assertTrue(path.isfile(self.test_file))
         header, data = ocb_ismag.load_supermag_ascii_data(self.test_file)
 
         # Test to see that the data keys are all in the header
@@ -109,9 +113,8 @@ class TestSuperMAGMethods(unittest.TestCase):
             # Test the number of rows and columns
             self.assertTupleEqual(test_out.shape, temp_out.shape)
 
-            # Test the data in each row
-            for i,test_row in enumerate(test_out):
-                self.assertListEqual(list(test_row), list(temp_out[i]))
+            # Test the data in all rows at once
+            np.testing.assert_array_equal(test_out, temp_out)
 
             del ldtype, test_out, temp_out
         else:
@@ -135,7 +138,7 @@ class TestSuperMAGMethods(unittest.TestCase):
         log_rec = log_handler.formatted_records
         # Test logging error message
         self.assertEqual(len(log_rec), 1)
-        self.assertTrue(log_rec[0].find("unable to create output file") > 0)
+        self.assertIn("unable to create output file", log_rec[0])
 
         log_handler.pop_thread()
         del log_rec, log_handler
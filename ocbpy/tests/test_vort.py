@@ -12,26 +12,31 @@ import datetime as dt
 
 class TestVortMethods(unittest.TestCase):
 
-    def setUp(self):
-        """ Initialize the OCBoundary object using the test file, as well as
-        the VectorData object
+    @classmethod
+    def setUpClass(cls):
+        """ Set the test file names and expected values once for all of the
+        tests
         """
         from os import path
         import ocbpy
         
-        self.ocb_dir = path.split(ocbpy.__file__)[0] 
-        self.test_ocb = path.join(self.ocb_dir, "tests", "test_data",
-                                  "test_north_circle")
-        self.test_file = path.join(self.ocb_dir, "tests", "test_data",
-                                   "test_vort")
-        self.test_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "out_vort")
-        self.temp_output = path.join(self.ocb_dir, "tests", "test_data",
-                                     "temp_vort")
-        self.test_vals = {'CENTRE_MLAT':67.27, 'DAY':5, 'MLT':3.127,
-                          'UTH':13.65, 'VORTICITY':0.0020967, 'YEAR':2000,
-                          'DATETIME':dt.datetime(2000,5,5,13,39,00), 'MONTH':5}
-        self.assertTrue(path.isfile(self.test_file))
+        cls.ocb_dir = path.split(ocbpy.__file__)[0] 
+        cls.test_ocb = path.join(cls.ocb_dir, "tests", "test_data",
+                                 "test_north_circle")
+        cls.test_file = path.join(cls.ocb_dir, "tests", "test_data",
+                                  "test_vort")
+        cls.test_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "out_vort")
+        cls.temp_output = path.join(cls.ocb_dir, "tests", "test_data",
+                                    "temp_vort")
+        cls.test_vals = {'CENTRE_MLAT':67.27, 'DAY':5, 'MLT':3.127,
+                         'UTH':13.65, 'VORTICITY':0.0020967, 'YEAR':2000,
+                         'DATETIME':dt.datetime(2000,5,5,13,39,00), 'MONTH':5}
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.ocb_dir, cls.test_file, cls.test_output, cls.test_ocb
+        del cls.temp_output, cls.test_vals
 
     def tearDown(self):
         import os
@@ -39,11 +44,12 @@ class TestVortMethods(unittest.TestCase):
         if os.path.isfile(self.temp_output):
             os.remove(self.temp_output)
 
-        del self.test_file, self.test_output, self.test_ocb, self.temp_output
-
     def test_load_vort_data(self):
         """ Test the routine to load the SuperDARN vorticity data
         """
+        from os import path
+
+        self.assertTrue(path.isfile(self.test_file))
         data = ocb_ivort.load_vorticity_ascii_data(self.test_file)
 
         # Test to see that the data keys are all in the header
@@ -58,15 +64,12 @@ class TestVortMethods(unittest.TestCase):
         for kk in self.test_vals.keys():
             self.assertEqual(data[kk][-1], self.test_vals[kk])
 
-        del data, ktest
-
     def test_load_failure(self):
         """ Test the routine to load the SuperDARN vorticity data
         """
         data = ocb_ivort.load_vorticity_ascii_data("fake_file")
 
         self.assertIsNone(data)
-        del data
 
     def test_wrong_load(self):
         """ Test the routine to load the SuperDARN vorticity data
@@ -76,7 +79,6 @@ class TestVortMethods(unittest.TestCase):
         data = ocb_ivort.load_vorticity_ascii_data(bad_file)
 
         self.assertIsNone(data)
-        del bad_file, data
 
     def test_load_all_vort_data(self):
         """ Test the routine to load the SuperDARN vorticity data, loading
@@ -93,8 +95,6 @@ class TestVortMethods(unittest.TestCase):
         for kk in self.test_vals.keys():
             self.assertEqual(data[kk][-1], self.test_vals[kk])
 
-        del data
-
     def test_vort2ascii_ocb(self):
         """ Test the conversion of vorticity data from AACGM coordinates into
         OCB coordinates
@@ -116,11 +116,8 @@ class TestVortMethods(unittest.TestCase):
             # Test the number of rows and columns
             self.assertTupleEqual(test_out.shape, temp_out.shape)
 
-            # Test the data in each row
-            for i,test_row in enumerate(test_out):
-                self.assertListEqual(list(test_row), list(temp_out[i]))
-
-            del ldtype, test_out, temp_out
+            # Test the data in all rows at once
+            np.testing.assert_array_equal(test_out, temp_out)
         else:
             import filecmp
             # Compare created file to stored test file
@@ -167,10 +164,9 @@ class TestVortMethods(unittest.TestCase):
         log_rec = log_handler.formatted_records
         # Test logging error message
         self.assertEqual(len(log_rec), 1)
-        self.assertTrue(log_rec[0].find("unable to create output file") > 0)
+        self.assertIn("unable to create output file", log_rec[0])
 
         log_handler.pop_thread()
-        del log_rec, log_handler
 
 if __name__ == '__main__':
     unittest.main()